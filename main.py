@@ -6,6 +6,7 @@ Claude reads session state, decides actions via skills, updates state, signals n
 """
 
 import argparse
+import functools
 import logging
 import sys
 from dataclasses import replace
@@ -20,6 +21,7 @@ from worker import (
     SignalStatus,
     add_session_handler,
     clear_signal_file,
+    close_notifications,
     extract_phase,
     extract_total_iterations,
     get_phase_config,
@@ -40,6 +42,10 @@ from worker import (
     validate_transition,
 )
 
+_SAMOCODE_DIR = Path(__file__).resolve().parent
+_LOG_DIR = _SAMOCODE_DIR / "logs"
+_WORKFLOW_PROMPT_PATH = _SAMOCODE_DIR / "workflow.md"
+
 
 def validate_and_process_signal(
     signal: Signal,
@@ -125,6 +131,12 @@ def validate_and_process_signal(
 
 def parse_args() -> argparse.Namespace:
     """Parse and validate command-line arguments."""
+    return _build_parser().parse_args()
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once; reused across parse_args() calls."""
     parser = argparse.ArgumentParser(
         description="Samocode - Autonomous Session Orchestrator",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -164,7 +176,7 @@ Examples:
         help="Override timeout in seconds (default: 1800 = 30 min)",
     )
 
-    return parser.parse_args()
+    return parser
 
 
 def load_config(args: argparse.Namespace) -> SamocodeConfig:
@@ -216,19 +228,15 @@ def load_config(args: argparse.Namespace) -> SamocodeConfig:
 def main() -> None:
     """Main orchestrator entry point."""
     args = parse_args()
-    samocode_dir = Path(__file__).parent
 
     config = load_config(args)
     session_path = config.session_path
     session_display_name = session_path.name
 
-    log_dir = samocode_dir / "logs"
-    workflow_prompt_path = samocode_dir / "workflow.md"
+    logger = setup_logging(_LOG_DIR)
 
-    logger = setup_logging(log_dir)
-
-    if not workflow_prompt_path.exists():
-        logger.error(f"Workflow prompt not found: {workflow_prompt_path}")
+    if not _WORKFLOW_PROMPT_PATH.exists():
+        logger.error(f"Workflow prompt not found: {_WORKFLOW_PROMPT_PATH}")
         logger.error("Create workflow.md with common session instructions")
         sys.exit(1)
 
@@ -251,12 +259,16 @@ def main() -> None:
     initial_dive = args.dive
     initial_task = args.task
     session_handler = None
+    overview_exists = False
 
     try:
         while True:
             iteration += 1
             # Track cumulative iterations in _overview.md (persists across restarts)
-            if session_path.exists() and (session_path / "_overview.md").exists():
+            # Overview is created by init and never removed, so stop probing once seen
+            if not overview_exists:
+                overview_exists = (session_path / "_overview.md").exists()
+            if overview_exists:
                 cumulative_iterations = increment_total_iterations(session_path)
 
             # Add session handler once session directory exists (created by Claude)
@@ -279,8 +291,12 @@ def main() -> None:
                 logger.info(f"Previous signal: {previous_signal}")
             logger.info("Cleared signal file")
 
+            # Write buffered session log before the long-running Claude call
+            if session_handler is not None:
+                session_handler.flush()
+
             result = run_claude_with_retry(
-                workflow_prompt_path,
+                _WORKFLOW_PROMPT_PATH,
                 session_path,
                 config,
                 initial_dive if iteration == 1 else None,
@@ -387,6 +403,9 @@ def main() -> None:
             pass
         sys.exit(1)
 
+    finally:
+        close_notifications()
+
 
 if __name__ == "__main__":
     main()
@@ -1,7 +1,44 @@
 """Shared test fixtures for worker package tests."""
 
-import pytest
+import logging
+import os
+from collections.abc import Iterator
 from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from worker import notifications
+from worker.logging import stop_logging
+from worker.notifications import send_telegram_message
+
+# Prefixes of environment variables read by RuntimeConfig.from_env
+_RUNTIME_ENV_PREFIXES = ("CLAUDE_", "SAMOCODE_", "TELEGRAM_", "GIT_BRANCH_PREFIX")
+
+
+@pytest.fixture(autouse=True)
+def reset_samocode_logger() -> Iterator[None]:
+    """Give each test an unconfigured samocode logger; close what it added."""
+    logger = logging.getLogger("samocode")
+    logger.handlers = []
+    yield
+    stop_logging()
+    for handler in logger.handlers:
+        handler.close()
+    logger.handlers = []
+
+
+@pytest.fixture(scope="session")
+def happy_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Valid repo/worktrees/sessions dirs plus a claude file, created once.
+
+    Shared across tests: don't modify it.
+    """
+    root = tmp_path_factory.mktemp("happy")
+    for name in ("repo", "worktrees", "sessions"):
+        (root / name).mkdir()
+    (root / "claude").touch()
+    return root
 
 
 @pytest.fixture
@@ -27,3 +64,35 @@ Blocked: no
     overview = temp_session / "_overview.md"
     overview.write_text(content)
     return overview
+
+
+@pytest.fixture
+def clean_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Remove runtime config variables so defaults apply."""
+    for key in list(os.environ):
+        if key.startswith(_RUNTIME_ENV_PREFIXES):
+            monkeypatch.delenv(key)
+
+
+@pytest.fixture
+def mock_sleep(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Skip real backoff sleeps between notification retries."""
+    mock = MagicMock()
+    monkeypatch.setattr(notifications.time, "sleep", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_post(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace the shared HTTP session; returns its post() mock."""
+    session = MagicMock()
+    monkeypatch.setattr(notifications, "_session", session)
+    return session.post
+
+
+@pytest.fixture
+def mock_send(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace send_telegram_message so notify_* messages can be inspected."""
+    mock = MagicMock(spec=send_telegram_message)
+    monkeypatch.setattr(notifications, "send_telegram_message", mock)
+    return mock
@@ -8,9 +8,8 @@ This module tests:
 - Config file parsing
 """
 
-import os
+from dataclasses import replace
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
@@ -19,26 +18,49 @@ from worker.config import (
     RuntimeConfig,
     SamocodeConfig,
     _parse_config_file,
+    _parse_config_lines,
     parse_samocode_file,
     resolve_session_path,
 )
 
 
+def make_runtime(claude_path: Path, **overrides: object) -> RuntimeConfig:
+    """Create a valid RuntimeConfig, overriding selected fields."""
+    runtime = RuntimeConfig(
+        telegram_bot_token="",
+        telegram_chat_id="",
+        claude_path=claude_path,
+        claude_model="opus",
+        claude_max_turns=100,
+        claude_timeout=600,
+        max_retries=3,
+        retry_delay=5,
+    )
+    return replace(runtime, **overrides)
+
+
+def write_config(path: Path, pairs: dict[str, str]) -> None:
+    """Write KEY=value lines to a .samocode file."""
+    path.write_bytes("".join(f"{k}={v}\n" for k, v in pairs.items()).encode())
+
+
 class TestProjectConfigFromFile:
     """Tests for ProjectConfig.from_file - loading project paths."""
 
-    def test_loads_all_required_fields(self, tmp_path: Path) -> None:
+    def test_loads_all_required_fields(self, tmp_path: Path, happy_tree: Path) -> None:
         """Successfully loads when all three fields present."""
-        repo = tmp_path / "repo"
-        worktrees = tmp_path / "worktrees"
-        sessions = tmp_path / "sessions"
-        repo.mkdir()
-        worktrees.mkdir()
-        sessions.mkdir()
+        repo = happy_tree / "repo"
+        worktrees = happy_tree / "worktrees"
+        sessions = happy_tree / "sessions"
 
         config_file = tmp_path / ".samocode"
-        config_file.write_text(
-            f"MAIN_REPO={repo}\n" f"WORKTREES={worktrees}\n" f"SESSIONS={sessions}\n"
+        write_config(
+            config_file,
+            {
+                "MAIN_REPO": str(repo),
+                "WORKTREES": str(worktrees),
+                "SESSIONS": str(sessions),
+            },
         )
 
         config = ProjectConfig.from_file(config_file)
@@ -64,7 +86,7 @@ class TestProjectConfigFromFile:
     def test_raises_when_main_repo_missing(self, tmp_path: Path) -> None:
         """Raises ValueError when MAIN_REPO field is missing."""
         config_file = tmp_path / ".samocode"
-        config_file.write_text("WORKTREES=/foo\nSESSIONS=/bar\n")
+        write_config(config_file, {"WORKTREES": "/foo", "SESSIONS": "/bar"})
 
         with pytest.raises(ValueError, match="MAIN_REPO"):
             ProjectConfig.from_file(config_file)
@@ -72,7 +94,7 @@ class TestProjectConfigFromFile:
     def test_raises_when_worktrees_missing(self, tmp_path: Path) -> None:
         """Raises ValueError when WORKTREES field is missing."""
         config_file = tmp_path / ".samocode"
-        config_file.write_text("MAIN_REPO=/foo\nSESSIONS=/bar\n")
+        write_config(config_file, {"MAIN_REPO": "/foo", "SESSIONS": "/bar"})
 
         with pytest.raises(ValueError, match="WORKTREES"):
             ProjectConfig.from_file(config_file)
@@ -80,7 +102,7 @@ class TestProjectConfigFromFile:
     def test_raises_when_sessions_missing(self, tmp_path: Path) -> None:
         """Raises ValueError when SESSIONS field is missing."""
         config_file = tmp_path / ".samocode"
-        config_file.write_text("MAIN_REPO=/foo\nWORKTREES=/bar\n")
+        write_config(config_file, {"MAIN_REPO": "/foo", "WORKTREES": "/bar"})
 
         with pytest.raises(ValueError, match="SESSIONS"):
             ProjectConfig.from_file(config_file)
@@ -88,8 +110,13 @@ class TestProjectConfigFromFile:
     def test_expands_tilde_paths(self, tmp_path: Path) -> None:
         """Tilde in paths is expanded to home directory."""
         config_file = tmp_path / ".samocode"
-        config_file.write_text(
-            "MAIN_REPO=~/repo\n" "WORKTREES=~/worktrees\n" "SESSIONS=~/sessions\n"
+        write_config(
+            config_file,
+            {
+                "MAIN_REPO": "~/repo",
+                "WORKTREES": "~/worktrees",
+                "SESSIONS": "~/sessions",
+            },
         )
 
         config = ProjectConfig.from_file(config_file)
@@ -103,19 +130,12 @@ class TestProjectConfigFromFile:
 class TestProjectConfigValidate:
     """Tests for ProjectConfig.validate - path validation."""
 
-    def test_valid_paths_return_empty(self, tmp_path: Path) -> None:
+    def test_valid_paths_return_empty(self, happy_tree: Path) -> None:
         """All paths existing returns no errors."""
-        repo = tmp_path / "repo"
-        worktrees = tmp_path / "worktrees"
-        sessions = tmp_path / "sessions"
-        repo.mkdir()
-        worktrees.mkdir()
-        sessions.mkdir()
-
         config = ProjectConfig(
-            main_repo=repo,
-            worktrees=worktrees,
-            sessions=sessions,
+            main_repo=happy_tree / "repo",
+            worktrees=happy_tree / "worktrees",
+            sessions=happy_tree / "sessions",
         )
 
         assert config.validate() == []
@@ -198,10 +218,9 @@ class TestProjectConfigValidate:
 class TestRuntimeConfigFromEnv:
     """Tests for RuntimeConfig.from_env - environment loading."""
 
-    def test_default_values(self) -> None:
+    def test_default_values(self, clean_env: None) -> None:
         """Default values used when env vars not set."""
-        with patch.dict(os.environ, {}, clear=True):
-            config = RuntimeConfig.from_env()
+        config = RuntimeConfig.from_env()
 
         assert config.claude_model == "opus"
         assert config.claude_max_turns == 300
@@ -210,81 +229,59 @@ class TestRuntimeConfigFromEnv:
         assert config.retry_delay == 5
         assert config.telegram_bot_token == ""
         assert config.telegram_chat_id == ""
+        assert config.git_branch_prefix == ""
 
-    def test_reads_claude_env_vars(self) -> None:
+    def test_reads_claude_env_vars(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Values read from CLAUDE_* environment variables."""
-        env = {
-            "CLAUDE_MODEL": "sonnet",
-            "CLAUDE_MAX_TURNS": "50",
-            "CLAUDE_TIMEOUT": "300",
-        }
-        with patch.dict(os.environ, env, clear=False):
-            config = RuntimeConfig.from_env()
+        monkeypatch.setenv("CLAUDE_MODEL", "sonnet")
+        monkeypatch.setenv("CLAUDE_MAX_TURNS", "50")
+        monkeypatch.setenv("CLAUDE_TIMEOUT", "300")
+
+        config = RuntimeConfig.from_env()
 
         assert config.claude_model == "sonnet"
         assert config.claude_max_turns == 50
         assert config.claude_timeout == 300
 
-    def test_reads_samocode_env_vars(self) -> None:
+    def test_reads_samocode_env_vars(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Values read from SAMOCODE_* environment variables."""
-        env = {
-            "SAMOCODE_MAX_RETRIES": "5",
-            "SAMOCODE_RETRY_DELAY": "10",
-        }
-        with patch.dict(os.environ, env, clear=False):
-            config = RuntimeConfig.from_env()
+        monkeypatch.setenv("SAMOCODE_MAX_RETRIES", "5")
+        monkeypatch.setenv("SAMOCODE_RETRY_DELAY", "10")
+
+        config = RuntimeConfig.from_env()
 
         assert config.max_retries == 5
         assert config.retry_delay == 10
 
-    def test_reads_telegram_env_vars(self) -> None:
+    def test_reads_telegram_env_vars(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Values read from TELEGRAM_* environment variables."""
-        env = {
-            "TELEGRAM_BOT_TOKEN": "my-token",
-            "TELEGRAM_CHAT_ID": "12345",
-        }
-        with patch.dict(os.environ, env, clear=False):
-            config = RuntimeConfig.from_env()
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "my-token")
+        monkeypatch.setenv("TELEGRAM_CHAT_ID", "12345")
+
+        config = RuntimeConfig.from_env()
 
         assert config.telegram_bot_token == "my-token"
         assert config.telegram_chat_id == "12345"
 
+    def test_reads_git_branch_prefix(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """GIT_BRANCH_PREFIX is read at load time."""
+        monkeypatch.setenv("GIT_BRANCH_PREFIX", "dev")
+
+        config = RuntimeConfig.from_env()
+
+        assert config.git_branch_prefix == "dev"
+
 
 class TestRuntimeConfigValidate:
     """Tests for RuntimeConfig.validate - runtime validation."""
 
-    def test_valid_config_returns_empty(self, tmp_path: Path) -> None:
+    def test_valid_config_returns_empty(self, happy_tree: Path) -> None:
         """Valid configuration returns no errors."""
-        claude = tmp_path / "claude"
-        claude.touch()
-
-        config = RuntimeConfig(
-            telegram_bot_token="",
-            telegram_chat_id="",
-            claude_path=claude,
-            claude_model="opus",
-            claude_max_turns=100,
-            claude_timeout=600,
-            max_retries=3,
-            retry_delay=5,
-        )
-
-        assert config.validate() == []
+        assert make_runtime(happy_tree / "claude").validate() == []
 
     def test_claude_path_not_found(self, tmp_path: Path) -> None:
         """Error when Claude CLI path doesn't exist."""
-        config = RuntimeConfig(
-            telegram_bot_token="",
-            telegram_chat_id="",
-            claude_path=tmp_path / "nonexistent",
-            claude_model="opus",
-            claude_max_turns=100,
-            claude_timeout=600,
-            max_retries=3,
-            retry_delay=5,
-        )
-
-        errors = config.validate()
+        errors = make_runtime(tmp_path / "nonexistent").validate()
 
         assert any("not found" in e for e in errors)
 
@@ -293,58 +290,19 @@ class TestRuntimeConfigValidate:
         claude_dir = tmp_path / "claude"
         claude_dir.mkdir()
 
-        config = RuntimeConfig(
-            telegram_bot_token="",
-            telegram_chat_id="",
-            claude_path=claude_dir,
-            claude_model="opus",
-            claude_max_turns=100,
-            claude_timeout=600,
-            max_retries=3,
-            retry_delay=5,
-        )
-
-        errors = config.validate()
+        errors = make_runtime(claude_dir).validate()
 
         assert any("not a file" in e for e in errors)
 
-    def test_invalid_max_turns(self, tmp_path: Path) -> None:
+    def test_invalid_max_turns(self, happy_tree: Path) -> None:
         """Error when max_turns is less than 1."""
-        claude = tmp_path / "claude"
-        claude.touch()
-
-        config = RuntimeConfig(
-            telegram_bot_token="",
-            telegram_chat_id="",
-            claude_path=claude,
-            claude_model="opus",
-            claude_max_turns=0,
-            claude_timeout=600,
-            max_retries=3,
-            retry_delay=5,
-        )
-
-        errors = config.validate()
+        errors = make_runtime(happy_tree / "claude", claude_max_turns=0).validate()
 
         assert any("max_turns" in e for e in errors)
 
-    def test_invalid_timeout(self, tmp_path: Path) -> None:
+    def test_invalid_timeout(self, happy_tree: Path) -> None:
         """Error when timeout is less than 1."""
-        claude = tmp_path / "claude"
-        claude.touch()
-
-        config = RuntimeConfig(
-            telegram_bot_token="",
-            telegram_chat_id="",
-            claude_path=claude,
-            claude_model="opus",
-            claude_max_turns=100,
-            claude_timeout=0,
-            max_retries=3,
-            retry_delay=5,
-        )
-
-        errors = config.validate()
+        errors = make_runtime(happy_tree / "claude", claude_timeout=0).validate()
 
         assert any("timeout" in e for e in errors)
 
@@ -381,6 +339,15 @@ class TestResolveSessionPath:
 
         assert result == new
 
+    def test_dated_match_requires_full_name(self, tmp_path: Path) -> None:
+        """Name must follow the date prefix exactly, not just be a suffix."""
+        (tmp_path / "26-01-15-my-task").mkdir()
+
+        result = resolve_session_path(tmp_path, "task")
+
+        assert result.name != "26-01-15-my-task"
+        assert result.name.endswith("-task")
+
     def test_exact_match_preferred_over_dated(self, tmp_path: Path) -> None:
         """Exact match takes precedence over dated match."""
         exact = tmp_path / "my-task"
@@ -401,6 +368,25 @@ class TestResolveSessionPath:
         # Format: YY-MM-DD-new-task
         assert result.name.count("-") >= 4  # Date has 2 dashes + name dashes
 
+    def test_missing_sessions_dir_returns_dated_path(self, tmp_path: Path) -> None:
+        """Returns new dated path when sessions dir doesn't exist yet."""
+        sessions = tmp_path / "missing"
+
+        result = resolve_session_path(sessions, "new-task")
+
+        assert result.parent == sessions
+        assert result.name.endswith("-new-task")
+
+    def test_sessions_path_is_file_returns_dated_path(self, tmp_path: Path) -> None:
+        """A SESSIONS path that is a file doesn't raise; validation reports it."""
+        sessions = tmp_path / "sessions"
+        sessions.touch()
+
+        result = resolve_session_path(sessions, "new-task")
+
+        assert result.parent == sessions
+        assert result.name.endswith("-new-task")
+
     def test_ignores_files_not_directories(self, tmp_path: Path) -> None:
         """Only matches directories, not files."""
         file_match = tmp_path / "26-01-15-my-task"
@@ -412,57 +398,53 @@ class TestResolveSessionPath:
         assert result != file_match
 
 
-class TestParseConfigFile:
-    """Tests for _parse_config_file - file format parsing."""
+class TestParseConfigLines:
+    """Tests for _parse_config_lines - file format parsing."""
 
-    def test_basic_key_value(self, tmp_path: Path) -> None:
+    def test_basic_key_value(self) -> None:
         """Parses simple key=value format."""
-        f = tmp_path / "config"
-        f.write_text("KEY=value\n")
-
-        assert _parse_config_file(f) == {"KEY": "value"}
+        assert _parse_config_lines(["KEY=value"]) == {"KEY": "value"}
 
-    def test_multiple_key_values(self, tmp_path: Path) -> None:
+    def test_multiple_key_values(self) -> None:
         """Parses multiple key=value pairs."""
-        f = tmp_path / "config"
-        f.write_text("KEY1=value1\nKEY2=value2\n")
+        result = _parse_config_lines(["KEY1=value1", "KEY2=value2"])
 
-        assert _parse_config_file(f) == {"KEY1": "value1", "KEY2": "value2"}
+        assert result == {"KEY1": "value1", "KEY2": "value2"}
 
-    def test_ignores_comments(self, tmp_path: Path) -> None:
+    def test_ignores_comments(self) -> None:
         """Lines starting with # are ignored."""
-        f = tmp_path / "config"
-        f.write_text("# comment\nKEY=value\n")
-
-        assert _parse_config_file(f) == {"KEY": "value"}
+        assert _parse_config_lines(["# comment", "KEY=value"]) == {"KEY": "value"}
 
-    def test_ignores_empty_lines(self, tmp_path: Path) -> None:
+    def test_ignores_empty_lines(self) -> None:
         """Empty lines are ignored."""
-        f = tmp_path / "config"
-        f.write_text("KEY1=value1\n\n   \nKEY2=value2\n")
+        result = _parse_config_lines(["KEY1=value1", "", "   ", "KEY2=value2"])
 
-        assert _parse_config_file(f) == {"KEY1": "value1", "KEY2": "value2"}
+        assert result == {"KEY1": "value1", "KEY2": "value2"}
 
-    def test_handles_equals_in_value(self, tmp_path: Path) -> None:
+    def test_handles_equals_in_value(self) -> None:
         """Only first = splits key from value."""
-        f = tmp_path / "config"
-        f.write_text("PATH=/foo=bar\n")
+        assert _parse_config_lines(["PATH=/foo=bar"]) == {"PATH": "/foo=bar"}
 
-        assert _parse_config_file(f) == {"PATH": "/foo=bar"}
-
-    def test_strips_whitespace(self, tmp_path: Path) -> None:
+    def test_strips_whitespace(self) -> None:
         """Whitespace around keys and values is stripped."""
-        f = tmp_path / "config"
-        f.write_text("  KEY  =  value with spaces  \n")
+        result = _parse_config_lines(["  KEY  =  value with spaces  "])
+
+        assert result == {"KEY": "value with spaces"}
+
+    def test_empty_file(self) -> None:
+        """No lines returns empty dict."""
+        assert _parse_config_lines([]) == {}
 
-        assert _parse_config_file(f) == {"KEY": "value with spaces"}
 
-    def test_empty_file(self, tmp_path: Path) -> None:
-        """Empty file returns empty dict."""
+class TestParseConfigFile:
+    """Tests for _parse_config_file - reading from disk."""
+
+    def test_reads_file(self, tmp_path: Path) -> None:
+        """Parses key=value pairs from a file on disk."""
         f = tmp_path / "config"
-        f.write_text("")
+        f.write_text("# comment\nKEY1=value1\nKEY2=value2\n")
 
-        assert _parse_config_file(f) == {}
+        assert _parse_config_file(f) == {"KEY1": "value1", "KEY2": "value2"}
 
 
 class TestParseSamocodeFileDeprecated:
@@ -488,6 +470,17 @@ class TestParseSamocodeFileDeprecated:
 
         assert result == {"PARENT": "found"}
 
+    def test_starts_from_file_path(self, tmp_path: Path) -> None:
+        """A file as start path is skipped and the walk continues upward."""
+        samocode = tmp_path / ".samocode"
+        samocode.write_text("KEY=value\n")
+        start_file = tmp_path / "main.py"
+        start_file.touch()
+
+        result = parse_samocode_file(start_file)
+
+        assert result == {"KEY": "value"}
+
     def test_returns_empty_dict_when_not_found(self, tmp_path: Path) -> None:
         """Returns empty dict when no .samocode file exists."""
         subdir = tmp_path / "empty"
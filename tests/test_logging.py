@@ -7,11 +7,13 @@ This module tests:
 """
 
 import logging
+from logging.handlers import MemoryHandler
 from pathlib import Path
 
 import pytest
 
-from worker.logging import add_session_handler, setup_logging
+from worker import logging as worker_logging
+from worker.logging import add_session_handler, setup_logging, stop_logging
 
 
 class TestSetupLogging:
@@ -29,18 +31,23 @@ class TestSetupLogging:
     def test_creates_log_file(self, tmp_path: Path) -> None:
         """Creates samocode.log file after logging a message."""
         log_dir = tmp_path / "logs"
-        # Clear existing handlers to ensure fresh setup
-        logger = logging.getLogger("samocode")
-        logger.handlers.clear()
 
         logger = setup_logging(log_dir)
         logger.info("Test message to create file")
-        # Flush all handlers
-        for handler in logger.handlers:
-            handler.flush()
+        # Flush queued records through to the file handler
+        stop_logging()
 
         assert (log_dir / "samocode.log").exists()
 
+    def test_log_file_opened_lazily(self, tmp_path: Path) -> None:
+        """samocode.log isn't created until the first record is written."""
+        log_dir = tmp_path / "logs"
+
+        setup_logging(log_dir)
+        stop_logging()
+
+        assert not (log_dir / "samocode.log").exists()
+
     def test_returns_logger(self, tmp_path: Path) -> None:
         """Returns the samocode logger."""
         logger = setup_logging(tmp_path / "logs")
@@ -61,18 +68,35 @@ class TestSetupLogging:
         assert logger1 is logger2
         assert handler_count1 == handler_count2
 
-    def test_has_console_and_file_handlers(self, tmp_path: Path) -> None:
-        """Sets up both console (StreamHandler) and file handlers."""
-        # Clear any existing handlers first
-        logger = logging.getLogger("samocode")
-        logger.handlers.clear()
+    def test_repeat_call_skips_setup(self, tmp_path: Path) -> None:
+        """Second call returns early without touching the filesystem."""
+        setup_logging(tmp_path / "logs")
+
+        setup_logging(tmp_path / "other-logs")
+
+        assert not (tmp_path / "other-logs").exists()
 
+    def test_has_console_and_file_handlers(self, tmp_path: Path) -> None:
+        """Sets up both console (StreamHandler) and file handlers behind a queue."""
         logger = setup_logging(tmp_path / "logs")
 
-        handler_types = [type(h).__name__ for h in logger.handlers]
+        assert [type(h).__name__ for h in logger.handlers] == ["QueueHandler"]
+        listener = worker_logging._listener
+        assert listener is not None
+        handler_types = [type(h).__name__ for h in listener.handlers]
         assert "StreamHandler" in handler_types
         assert "RotatingFileHandler" in handler_types
 
+    def test_stop_logging_flushes_queue(self, tmp_path: Path) -> None:
+        """Queued records reach the log file once stop_logging returns."""
+        log_dir = tmp_path / "logs"
+
+        logger = setup_logging(log_dir)
+        logger.info("Queued message")
+        stop_logging()
+
+        assert "Queued message" in (log_dir / "samocode.log").read_text()
+
 
 class TestAddSessionHandler:
     """Tests for add_session_handler - session-specific logging."""
@@ -86,24 +110,30 @@ class TestAddSessionHandler:
             add_session_handler(logger, nonexistent)
 
     def test_creates_session_log_file(self, tmp_path: Path) -> None:
-        """Creates session.log in session directory."""
+        """Creates session.log in session directory on first write."""
         session = tmp_path / "test-session"
         session.mkdir()
         logger = logging.getLogger("test_session2")
+        logger.setLevel(logging.INFO)
 
-        add_session_handler(logger, session)
+        handler = add_session_handler(logger, session)
+        assert not (session / "session.log").exists()
+
+        logger.info("First message")
+        handler.flush()
 
         assert (session / "session.log").exists()
 
     def test_returns_handler(self, tmp_path: Path) -> None:
-        """Returns the created FileHandler for later removal."""
+        """Returns a MemoryHandler wrapping the session FileHandler."""
         session = tmp_path / "test-session"
         session.mkdir()
         logger = logging.getLogger("test_session3")
 
         handler = add_session_handler(logger, session)
 
-        assert isinstance(handler, logging.FileHandler)
+        assert isinstance(handler, MemoryHandler)
+        assert isinstance(handler.target, logging.FileHandler)
         assert handler in logger.handlers
 
     def test_handler_includes_session_name(self, tmp_path: Path) -> None:
@@ -113,7 +143,8 @@ class TestAddSessionHandler:
         logger = logging.getLogger("test_session4")
 
         handler = add_session_handler(logger, session)
-        formatter = handler.formatter
+        assert handler.target is not None
+        formatter = handler.target.formatter
 
         # Formatter should include session name in format string
         assert formatter is not None
@@ -133,3 +164,21 @@ class TestAddSessionHandler:
 
         log_content = (session / "session.log").read_text()
         assert "Test message" in log_content
+
+    def test_buffers_until_flush(self, tmp_path: Path) -> None:
+        """INFO records are held until flush; ERROR flushes immediately."""
+        session = tmp_path / "test-session"
+        session.mkdir()
+        logger = logging.getLogger("test_session6")
+        logger.setLevel(logging.INFO)
+
+        add_session_handler(logger, session)
+        logger.info("Buffered message")
+
+        assert not (session / "session.log").exists()
+
+        logger.error("Error message")
+
+        log_content = (session / "session.log").read_text()
+        assert "Buffered message" in log_content
+        assert "Error message" in log_content
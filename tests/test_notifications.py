@@ -6,11 +6,16 @@ This module tests:
 - Message formatting for each notification type
 """
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
+import pytest
 import requests
 
 from worker.notifications import (
+    MAX_ATTEMPTS,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+    _retry_delay,
     notify_blocked,
     notify_complete,
     notify_error,
@@ -18,157 +23,187 @@ from worker.notifications import (
     send_telegram_message,
 )
 
+# Skip real backoff sleeps in every test here
+pytestmark = pytest.mark.usefixtures("mock_sleep")
+
 
 class TestSendTelegramMessage:
     """Tests for send_telegram_message - HTTP posting to Telegram."""
 
-    def test_not_configured_skips_request(self) -> None:
+    def test_not_configured_skips_request(self, mock_post: MagicMock) -> None:
         """Returns False immediately when bot_token or chat_id empty."""
-        with patch("worker.notifications.requests.post") as mock_post:
-            result = send_telegram_message("test", "", "123")
+        result = send_telegram_message("test", "", "123")
 
-            assert result is False
-            mock_post.assert_not_called()
+        assert result is False
+        mock_post.assert_not_called()
 
-    def test_not_configured_empty_chat_id(self) -> None:
+    def test_not_configured_empty_chat_id(self, mock_post: MagicMock) -> None:
         """Returns False when chat_id is empty."""
-        with patch("worker.notifications.requests.post") as mock_post:
-            result = send_telegram_message("test", "token", "")
+        result = send_telegram_message("test", "token", "")
 
-            assert result is False
-            mock_post.assert_not_called()
+        assert result is False
+        mock_post.assert_not_called()
 
-    def test_successful_send(self) -> None:
+    def test_successful_send(self, mock_post: MagicMock) -> None:
         """Returns True on successful HTTP post."""
-        with patch("worker.notifications.requests.post") as mock_post:
-            mock_post.return_value.raise_for_status = MagicMock()
+        result = send_telegram_message("Hello", "bot_token", "chat_id")
+
+        assert result is True
+        mock_post.assert_called_once()
+        call_args = mock_post.call_args
+        assert "bot_token" in call_args[0][0]
+        assert call_args[1]["json"]["text"] == "Hello"
+        assert call_args[1]["json"]["chat_id"] == "chat_id"
+
+    def test_timeout_retries_with_backoff(
+        self, mock_post: MagicMock, mock_sleep: MagicMock
+    ) -> None:
+        """Retries on timeout up to MAX_ATTEMPTS, sleeping between attempts."""
+        mock_post.side_effect = requests.Timeout()
+
+        result = send_telegram_message("test", "token", "chat")
+
+        assert result is False
+        assert mock_post.call_count == MAX_ATTEMPTS
+        assert mock_sleep.call_count == MAX_ATTEMPTS - 1
 
-            result = send_telegram_message("Hello", "bot_token", "chat_id")
+    def test_connection_error_retries_with_backoff(self, mock_post: MagicMock) -> None:
+        """Retries on connection error up to MAX_ATTEMPTS, then returns False."""
+        mock_post.side_effect = requests.ConnectionError()
 
-            assert result is True
-            mock_post.assert_called_once()
-            call_args = mock_post.call_args
-            assert "bot_token" in call_args[0][0]
-            assert call_args[1]["json"]["text"] == "Hello"
-            assert call_args[1]["json"]["chat_id"] == "chat_id"
+        result = send_telegram_message("test", "token", "chat")
 
-    def test_timeout_retries_once(self) -> None:
-        """Retries once on timeout, then returns False."""
-        with patch("worker.notifications.requests.post") as mock_post:
-            mock_post.side_effect = requests.Timeout()
+        assert result is False
+        assert mock_post.call_count == MAX_ATTEMPTS
 
-            result = send_telegram_message("test", "token", "chat")
+    def test_retryable_http_status_retries(self, mock_post: MagicMock) -> None:
+        """429/5xx responses are retried."""
+        error_response = MagicMock(status_code=503)
+        error_response.raise_for_status.side_effect = requests.HTTPError(
+            response=error_response
+        )
+        mock_post.side_effect = [error_response, MagicMock()]
 
-            assert result is False
-            assert mock_post.call_count == 2
+        result = send_telegram_message("test", "token", "chat")
 
-    def test_connection_error_retries_once(self) -> None:
-        """Retries once on connection error, then returns False."""
-        with patch("worker.notifications.requests.post") as mock_post:
-            mock_post.side_effect = requests.ConnectionError()
+        assert result is True
+        assert mock_post.call_count == 2
 
-            result = send_telegram_message("test", "token", "chat")
+    def test_client_http_error_no_retry(self, mock_post: MagicMock) -> None:
+        """4xx responses other than 429 fail immediately."""
+        error_response = MagicMock(status_code=400)
+        error_response.raise_for_status.side_effect = requests.HTTPError(
+            response=error_response
+        )
+        mock_post.return_value = error_response
 
-            assert result is False
-            assert mock_post.call_count == 2
+        result = send_telegram_message("test", "token", "chat")
 
-    def test_request_exception_no_retry(self) -> None:
+        assert result is False
+        assert mock_post.call_count == 1
+
+    def test_request_exception_no_retry(self, mock_post: MagicMock) -> None:
         """Other request exceptions don't retry."""
-        with patch("worker.notifications.requests.post") as mock_post:
-            mock_post.side_effect = requests.RequestException("Bad request")
+        mock_post.side_effect = requests.RequestException("Bad request")
 
-            result = send_telegram_message("test", "token", "chat")
+        result = send_telegram_message("test", "token", "chat")
 
-            assert result is False
-            assert mock_post.call_count == 1
+        assert result is False
+        assert mock_post.call_count == 1
 
-    def test_success_after_retry(self) -> None:
+    def test_success_after_retry(self, mock_post: MagicMock) -> None:
         """Returns True if second attempt succeeds."""
-        with patch("worker.notifications.requests.post") as mock_post:
-            mock_response = MagicMock()
-            mock_response.raise_for_status = MagicMock()
-            mock_post.side_effect = [requests.Timeout(), mock_response]
+        mock_post.side_effect = [requests.Timeout(), MagicMock()]
 
-            result = send_telegram_message("test", "token", "chat")
+        result = send_telegram_message("test", "token", "chat")
 
-            assert result is True
-            assert mock_post.call_count == 2
+        assert result is True
+        assert mock_post.call_count == 2
 
 
 class TestNotifyBlocked:
     """Tests for notify_blocked - blocked workflow notification."""
 
-    def test_formats_message_with_needs(self) -> None:
+    def test_formats_message_with_needs(self, mock_send: MagicMock) -> None:
         """Message includes reason and needs."""
-        with patch("worker.notifications.send_telegram_message") as mock_send:
-            notify_blocked("Test failure", "my-session", "help", "token", "chat")
+        notify_blocked("Test failure", "my-session", "help", "token", "chat")
 
-            mock_send.assert_called_once()
-            message = mock_send.call_args[0][0]
-            assert "Blocked" in message
-            assert "my-session" in message
-            assert "Test failure" in message
-            assert "help" in message
+        mock_send.assert_called_once()
+        message = mock_send.call_args[0][0]
+        assert "Blocked" in message
+        assert "my-session" in message
+        assert "Test failure" in message
+        assert "help" in message
 
-    def test_formats_message_without_needs(self) -> None:
+    def test_formats_message_without_needs(self, mock_send: MagicMock) -> None:
         """Message works without needs field."""
-        with patch("worker.notifications.send_telegram_message") as mock_send:
-            notify_blocked("Test failure", "my-session", None, "token", "chat")
+        notify_blocked("Test failure", "my-session", None, "token", "chat")
 
-            message = mock_send.call_args[0][0]
-            assert "Blocked" in message
-            assert "Test failure" in message
+        message = mock_send.call_args[0][0]
+        assert "Blocked" in message
+        assert "Test failure" in message
 
 
 class TestNotifyWaiting:
     """Tests for notify_waiting - waiting for input notification."""
 
-    def test_formats_message(self) -> None:
+    def test_formats_message(self, mock_send: MagicMock) -> None:
         """Message includes waiting_for info."""
-        with patch("worker.notifications.send_telegram_message") as mock_send:
-            notify_waiting("qa_answers", "my-session", "token", "chat")
+        notify_waiting("qa_answers", "my-session", "token", "chat")
 
-            message = mock_send.call_args[0][0]
-            assert "Waiting" in message
-            assert "my-session" in message
-            assert "qa_answers" in message
+        message = mock_send.call_args[0][0]
+        assert "Waiting" in message
+        assert "my-session" in message
+        assert "qa_answers" in message
 
 
 class TestNotifyComplete:
     """Tests for notify_complete - workflow completed notification."""
 
-    def test_formats_message(self) -> None:
+    def test_formats_message(self, mock_send: MagicMock) -> None:
         """Message includes summary and iterations."""
-        with patch("worker.notifications.send_telegram_message") as mock_send:
-            notify_complete("All done!", "my-session", 5, "token", "chat")
+        notify_complete("All done!", "my-session", 5, "token", "chat")
 
-            message = mock_send.call_args[0][0]
-            assert "Complete" in message
-            assert "my-session" in message
-            assert "All done!" in message
-            assert "5" in message
+        message = mock_send.call_args[0][0]
+        assert "Complete" in message
+        assert "my-session" in message
+        assert "All done!" in message
+        assert "5" in message
 
 
 class TestNotifyError:
     """Tests for notify_error - error notification."""
 
-    def test_formats_message(self) -> None:
+    def test_formats_message(self, mock_send: MagicMock) -> None:
         """Message includes error and iteration."""
-        with patch("worker.notifications.send_telegram_message") as mock_send:
-            notify_error("Something broke", "my-session", 3, "token", "chat")
+        notify_error("Something broke", "my-session", 3, "token", "chat")
 
-            message = mock_send.call_args[0][0]
-            assert "Error" in message
-            assert "my-session" in message
-            assert "Something broke" in message
-            assert "3" in message
+        message = mock_send.call_args[0][0]
+        assert "Error" in message
+        assert "my-session" in message
+        assert "Something broke" in message
+        assert "3" in message
 
-    def test_truncates_long_error(self) -> None:
+    def test_truncates_long_error(self, mock_send: MagicMock) -> None:
         """Long error messages are truncated."""
-        with patch("worker.notifications.send_telegram_message") as mock_send:
-            long_error = "x" * 600
-            notify_error(long_error, "my-session", 1, "token", "chat")
+        long_error = "x" * 600
+        notify_error(long_error, "my-session", 1, "token", "chat")
+
+        message = mock_send.call_args[0][0]
+        assert len(message) < 700
+        assert "..." in message
+
+
+class TestRetryDelay:
+    """Tests for _retry_delay - exponential backoff with jitter."""
+
+    def test_doubles_per_attempt(self) -> None:
+        """Delay grows exponentially, with jitter below one base delay."""
+        for attempt in (1, 2, 3):
+            delay = _retry_delay(attempt)
+            backoff = RETRY_BASE_DELAY * 2 ** (attempt - 1)
+            assert backoff <= delay <= backoff + RETRY_BASE_DELAY
 
-            message = mock_send.call_args[0][0]
-            assert len(message) < 700
-            assert "..." in message
+    def test_capped(self) -> None:
+        """Backoff never exceeds RETRY_MAX_DELAY plus jitter."""
+        assert _retry_delay(50) <= RETRY_MAX_DELAY + RETRY_BASE_DELAY
@@ -6,26 +6,38 @@ This module tests:
 - Overview extraction utilities
 - Log filename generation
 - Prompt building
-- Log streaming (mocked)
+- Log streaming (real subprocess)
 - CLI execution (mocked)
 """
 
+import os
+import signal
 import subprocess
+import sys
+import time
+from dataclasses import replace
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
 
+from worker import runner
 from worker.config import ProjectConfig, RuntimeConfig, SamocodeConfig
 from worker.phases import Phase, get_agent_for_phase
 from worker.runner import (
+    MAX_RETRY_DELAY,
+    STDOUT_TAIL_CHARS,
     ExecutionResult,
     ExecutionStatus,
     build_session_context,
     extract_iteration,
     extract_phase,
     generate_log_filename,
+    increment_total_iterations,
+    parse_overview,
     run_claude_once,
     run_claude_with_retry,
+    stream_logs,
     update_phase,
 )
 
@@ -157,6 +169,21 @@ class TestBuildSessionContext:
         assert "Worktree Configuration" in context
         assert str(config.repo_path) in context
 
+    def test_branch_name_uses_prefix(self, tmp_path: Path) -> None:
+        """Branch name drops the date and applies git_branch_prefix."""
+        workflow = tmp_path / "workflow.md"
+        workflow.write_text("# Workflow")
+        config = make_config(tmp_path)
+        config = replace(
+            config, runtime=replace(config.runtime, git_branch_prefix="dev")
+        )
+        session = tmp_path / "26-01-13-my-feature"
+        session.mkdir()
+
+        context = build_session_context(workflow, session, config)
+
+        assert "- Branch name: `dev/my-feature`" in context
+
     def test_with_initial_instructions(self, tmp_path: Path) -> None:
         """Context includes initial dive/task instructions."""
         workflow = tmp_path / "workflow.md"
@@ -178,6 +205,36 @@ class TestBuildSessionContext:
         assert "add feature" in context
         assert "IMPORTANT" in context
 
+    def test_workflow_read_cached(self, tmp_path: Path) -> None:
+        """Unchanged workflow.md is read from disk only once."""
+        workflow = tmp_path / "workflow.md"
+        workflow.write_text("# Cached Workflow")
+        config = make_config(tmp_path)
+        session = tmp_path / "test-session"
+        session.mkdir()
+
+        build_session_context(workflow, session, config)
+        with patch.object(Path, "read_text") as mock_read:
+            context = build_session_context(workflow, session, config)
+
+        mock_read.assert_not_called()
+        assert "Cached Workflow" in context
+
+    def test_workflow_cache_invalidated_on_change(self, tmp_path: Path) -> None:
+        """Modified workflow.md is re-read."""
+        workflow = tmp_path / "workflow.md"
+        workflow.write_text("# Old")
+        config = make_config(tmp_path)
+        session = tmp_path / "test-session"
+        session.mkdir()
+
+        build_session_context(workflow, session, config)
+        workflow.write_text("# New workflow")
+        context = build_session_context(workflow, session, config)
+
+        assert "New workflow" in context
+        assert "# Old" not in context
+
 
 class TestExtractPhase:
     """Tests for extract_phase - parsing phase from _overview.md."""
@@ -212,6 +269,79 @@ class TestExtractPhase:
         assert result == "implementation"
 
 
+class TestParseOverview:
+    """Tests for parse_overview - single-pass status parsing."""
+
+    def test_overview_not_exists(self, temp_session: Path) -> None:
+        """Returns None when _overview.md doesn't exist."""
+        assert parse_overview(temp_session) is None
+
+    def test_parses_all_fields(self, temp_session: Path, sample_overview: Path) -> None:
+        """Extracts phase, iteration and total iterations together."""
+        sample_overview.write_text(
+            sample_overview.read_text().replace(
+                "Iteration: 5", "Iteration: 5\nTotal Iterations: 12"
+            )
+        )
+
+        result = parse_overview(temp_session)
+
+        assert result is not None
+        assert result.phase == "implementation"
+        assert result.iteration == 5
+        assert result.total_iterations == 12
+
+    def test_missing_fields_use_defaults(self, temp_session: Path) -> None:
+        """Missing fields become None, total iterations becomes 0."""
+        (temp_session / "_overview.md").write_text("# Session\n")
+
+        result = parse_overview(temp_session)
+
+        assert result is not None
+        assert result.phase is None
+        assert result.iteration is None
+        assert result.total_iterations == 0
+
+    def test_first_occurrence_wins(self, temp_session: Path) -> None:
+        """Matches the single-field extractors when a field repeats."""
+        (temp_session / "_overview.md").write_text(
+            "Phase: planning\nIteration: 2\nPhase: done\nIteration: 9\n"
+        )
+
+        result = parse_overview(temp_session)
+
+        assert result is not None
+        assert result.phase == extract_phase(temp_session) == "planning"
+        assert result.iteration == extract_iteration(temp_session) == 2
+
+    def test_reads_own_write_from_cache(
+        self, temp_session: Path, sample_overview: Path
+    ) -> None:
+        """After increment_total_iterations, parsing doesn't re-read the file."""
+        parse_overview(temp_session)
+        increment_total_iterations(temp_session)
+
+        with patch.object(Path, "read_text") as mock_read:
+            result = parse_overview(temp_session)
+
+        mock_read.assert_not_called()
+        assert result is not None
+        assert result.total_iterations == 1
+
+    def test_external_change_reparsed(
+        self, temp_session: Path, sample_overview: Path
+    ) -> None:
+        """Edits made outside the orchestrator are picked up."""
+        parse_overview(temp_session)
+
+        sample_overview.write_text("Phase: testing\nIteration: 7\n")
+        result = parse_overview(temp_session)
+
+        assert result is not None
+        assert result.phase == "testing"
+        assert result.iteration == 7
+
+
 class TestUpdatePhase:
     """Tests for update_phase - updating phase in _overview.md."""
 
@@ -342,6 +472,134 @@ class TestGenerateLogFilename:
         assert "init" in filename.name
 
 
+class TestStreamLogs:
+    """Tests for stream_logs - streaming real process output."""
+
+    def test_streams_stdout_to_log_file(self, tmp_path: Path) -> None:
+        """Captures stdout/stderr and writes stdout lines to the log file."""
+        log_file = tmp_path / "_logs" / "run.jsonl"
+        script = (
+            "import sys; print('line1'); print('line2'); print('oops', file=sys.stderr)"
+        )
+        process = subprocess.Popen(
+            [sys.executable, "-c", script],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+        seen: list[str] = []
+
+        stdout, stderr = stream_logs(process, log_file, 10, seen.append)
+
+        assert stdout == "line1\nline2\n"
+        assert stderr == "oops\n"
+        assert seen == ["line1\n", "line2\n"]
+        assert log_file.read_text() == "line1\nline2\n"
+        assert process.returncode == 0
+
+    def test_keeps_only_stdout_tail_in_memory(self, tmp_path: Path) -> None:
+        """Returned stdout is bounded; the log file has the full output."""
+        log_file = tmp_path / "run.jsonl"
+        total = STDOUT_TAIL_CHARS
+        process = subprocess.Popen(
+            [sys.executable, "-c", f"[print(i) for i in range({total})]"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+
+        stdout, _ = stream_logs(process, log_file, 10)
+
+        assert len(stdout) == STDOUT_TAIL_CHARS
+        assert stdout.endswith(f"\n{total - 1}\n")
+        assert len(log_file.read_text().splitlines()) == total
+
+    def test_translates_newlines_and_keeps_partial_line(self, tmp_path: Path) -> None:
+        """CRLF becomes LF and a final line without newline is kept."""
+        log_file = tmp_path / "run.jsonl"
+        script = r"import sys; sys.stdout.write('a\r\nb'); sys.stdout.flush()"
+        process = subprocess.Popen(
+            [sys.executable, "-c", script],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+
+        stdout, _ = stream_logs(process, log_file, 10)
+
+        assert stdout == "a\nb"
+        assert log_file.read_text() == "a\nb"
+
+    def test_bounds_single_long_line(self, tmp_path: Path) -> None:
+        """A single oversized line is trimmed to the tail size."""
+        log_file = tmp_path / "run.jsonl"
+        size = STDOUT_TAIL_CHARS * 4
+        process = subprocess.Popen(
+            [sys.executable, "-c", f"print('a' * {size} + 'end')"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+
+        stdout, _ = stream_logs(process, log_file, 10)
+
+        assert len(stdout) == STDOUT_TAIL_CHARS
+        assert stdout.endswith("aend\n")
+        assert len(log_file.read_text()) == size + 4
+
+    def test_returns_when_grandchild_holds_pipes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Stops draining shortly after exit even if the pipes stay open."""
+        monkeypatch.setattr(runner, "EXIT_DRAIN_TIMEOUT", 0.2)
+        log_file = tmp_path / "run.jsonl"
+        script = (
+            "import subprocess, sys; "
+            "p = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']); "
+            "print(p.pid); print('done')"
+        )
+        process = subprocess.Popen(
+            [sys.executable, "-c", script],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+
+        start = time.monotonic()
+        try:
+            stdout, _ = stream_logs(process, log_file, 10)
+        finally:
+            grandchild_pid = int(log_file.read_text().split()[0])
+            os.kill(grandchild_pid, signal.SIGKILL)
+
+        assert time.monotonic() - start < 5
+        assert stdout.endswith("done\n")
+        assert process.returncode == 0
+
+    def test_raises_on_timeout(self, tmp_path: Path) -> None:
+        """Raises TimeoutExpired when process outlives the timeout."""
+        log_file = tmp_path / "run.jsonl"
+        process = subprocess.Popen(
+            [sys.executable, "-c", "import time; time.sleep(10)"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+
+        try:
+            with pytest.raises(subprocess.TimeoutExpired):
+                stream_logs(process, log_file, 0.2)
+        finally:
+            process.kill()
+            process.wait()
+
+
 class TestRunClaudeOnce:
     """Tests for run_claude_once - single CLI execution."""
 
@@ -373,6 +631,33 @@ class TestRunClaudeOnce:
         assert result.status == ExecutionStatus.SUCCESS
         assert result.attempt == 1
 
+    def test_stdin_detached_from_terminal(self, tmp_path: Path) -> None:
+        """Child gets /dev/null as stdin instead of the orchestrator's terminal."""
+        workflow = tmp_path / "workflow.md"
+        workflow.write_text("# Workflow")
+        sessions_dir = tmp_path / "sessions"
+        sessions_dir.mkdir()
+        session = sessions_dir / "test-session"
+        session.mkdir()
+        project_dir = tmp_path / "project"
+        project_dir.mkdir()
+        (session / "_overview.md").write_text("Phase: init\n")
+        config = make_config(tmp_path, repo_path=project_dir)
+
+        with patch("worker.runner.subprocess.Popen") as mock_popen:
+            mock_process = MagicMock()
+            mock_process.returncode = 0
+            mock_popen.return_value = mock_process
+
+            with patch("worker.runner.stream_logs") as mock_stream:
+                mock_stream.return_value = ("", "")
+
+                run_claude_once(workflow, session, config, 1)
+
+        cli_args = mock_popen.call_args[0][0]
+        assert cli_args[-2:] == ["-p", "Start"]
+        assert mock_popen.call_args[1]["stdin"] == subprocess.DEVNULL
+
     def test_failure_case(self, tmp_path: Path) -> None:
         """Returns FAILURE status on non-zero return code."""
         workflow = tmp_path / "workflow.md"
@@ -432,6 +717,32 @@ class TestRunClaudeOnce:
 
         assert result.status == ExecutionStatus.TIMEOUT
 
+    def test_interrupt_kills_process(self, tmp_path: Path) -> None:
+        """Ctrl-C kills the CLI process and propagates KeyboardInterrupt."""
+        workflow = tmp_path / "workflow.md"
+        workflow.write_text("# Workflow")
+        sessions_dir = tmp_path / "sessions"
+        sessions_dir.mkdir()
+        session = sessions_dir / "test-session"
+        session.mkdir()
+        project_dir = tmp_path / "project"
+        project_dir.mkdir()
+        (session / "_overview.md").write_text("Phase: init\n")
+        config = make_config(tmp_path, repo_path=project_dir)
+
+        with patch("worker.runner.subprocess.Popen") as mock_popen:
+            mock_process = MagicMock()
+            mock_popen.return_value = mock_process
+
+            with patch("worker.runner.stream_logs") as mock_stream:
+                mock_stream.side_effect = KeyboardInterrupt
+
+                with pytest.raises(KeyboardInterrupt):
+                    run_claude_once(workflow, session, config, 1)
+
+        mock_process.kill.assert_called_once()
+        mock_process.wait.assert_called_once()
+
 
 class TestRunClaudeWithRetry:
     """Tests for run_claude_with_retry - retry wrapper."""
@@ -510,3 +821,27 @@ class TestRunClaudeWithRetry:
 
         assert result.status == ExecutionStatus.RETRY_EXHAUSTED
         assert mock_run.call_count == config.max_retries
+
+    def test_exponential_backoff(self, tmp_path: Path) -> None:
+        """Delay doubles after each failed attempt, capped at MAX_RETRY_DELAY."""
+        workflow = tmp_path / "workflow.md"
+        workflow.write_text("# Workflow")
+        session = tmp_path / "session"
+        session.mkdir()
+        config = make_config(tmp_path)
+        runtime = replace(config.runtime, max_retries=5, retry_delay=10)
+        config = replace(config, runtime=runtime)
+
+        with patch("worker.runner.run_claude_once") as mock_run:
+            mock_run.return_value = ExecutionResult(
+                status=ExecutionStatus.FAILURE,
+                stdout="",
+                stderr="error",
+                returncode=1,
+                attempt=1,
+            )
+            with patch("worker.runner.time.sleep") as mock_sleep:
+                run_claude_with_retry(workflow, session, config)
+
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays == [10, 20, 40, MAX_RETRY_DELAY]
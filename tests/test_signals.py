@@ -7,9 +7,12 @@ This module tests:
 - Error handling for invalid/missing signals
 """
 
+import dataclasses
 import json
 from pathlib import Path
 
+import pytest
+
 
 from worker.signals import (
     Signal,
@@ -86,6 +89,17 @@ class TestSignalToDict:
         assert result["needs"] == "error_resolution"
 
 
+class TestSignalImmutability:
+    """Tests for Signal being frozen."""
+
+    def test_cannot_mutate(self) -> None:
+        """Assigning a field raises FrozenInstanceError."""
+        signal = Signal(status=SignalStatus.CONTINUE)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            signal.phase = "testing"  # type: ignore[misc]
+
+
 class TestClearSignalFile:
     """Tests for clear_signal_file - creating empty signal."""
 
@@ -123,6 +137,17 @@ class TestClearSignalFile:
         assert json.loads(signal_file.read_text()) == {}
         assert result == '{"status": "done", "summary": "old"}'
 
+    def test_returns_previous_contents_as_utf8(self, tmp_path: Path) -> None:
+        """Previous contents decode as UTF-8 regardless of locale."""
+        session = tmp_path / "session"
+        session.mkdir()
+        previous = '{"status": "done", "summary": "Готово ✓"}'
+        (session / "_signal.json").write_bytes(previous.encode())
+
+        result = clear_signal_file(session)
+
+        assert result == previous
+
     def test_returns_none_for_empty_signal(self, tmp_path: Path) -> None:
         """Returns None when previous signal was empty object."""
         session = tmp_path / "session"
@@ -134,6 +159,15 @@ class TestClearSignalFile:
 
         assert result is None
 
+    def test_leaves_no_temp_file(self, tmp_path: Path) -> None:
+        """Atomic write doesn't leave the temp file behind."""
+        session = tmp_path / "session"
+        session.mkdir()
+
+        clear_signal_file(session)
+
+        assert sorted(p.name for p in session.iterdir()) == ["_signal.json"]
+
 
 class TestReadSignalFile:
     """Tests for read_signal_file - parsing signal files."""
@@ -223,6 +257,29 @@ class TestReadSignalFile:
         assert signal.reason is not None
         assert "Invalid signal status" in signal.reason
 
+    def test_non_string_status_returns_blocked(self, tmp_path: Path) -> None:
+        """Returns BLOCKED with invalid-status reason for non-string status."""
+        session = tmp_path / "session"
+        session.mkdir()
+        (session / "_signal.json").write_text('{"status": 42}')
+
+        signal = read_signal_file(session)
+
+        assert signal.status == SignalStatus.BLOCKED
+        assert signal.reason == "Invalid signal status: 42"
+
+    def test_parses_utf8_regardless_of_locale(self, tmp_path: Path) -> None:
+        """Signal JSON is decoded as UTF-8 per the JSON spec."""
+        session = tmp_path / "session"
+        session.mkdir()
+        (session / "_signal.json").write_bytes(
+            '{"status": "done", "summary": "Готово ✓"}'.encode()
+        )
+
+        signal = read_signal_file(session)
+
+        assert signal.summary == "Готово ✓"
+
     def test_invalid_json_returns_blocked(self, tmp_path: Path) -> None:
         """Returns BLOCKED for malformed JSON."""
         session = tmp_path / "session"
@@ -7,8 +7,14 @@ from .config import (
     parse_samocode_file,
     resolve_session_path,
 )
-from .logging import add_session_handler, setup_logging
-from .notifications import notify_blocked, notify_complete, notify_error, notify_waiting
+from .logging import add_session_handler, setup_logging, stop_logging
+from .notifications import (
+    close_notifications,
+    notify_blocked,
+    notify_complete,
+    notify_error,
+    notify_waiting,
+)
 from .phases import (
     Phase,
     PhaseConfig,
@@ -22,9 +28,11 @@ from .phases import (
 from .runner import (
     ExecutionResult,
     ExecutionStatus,
+    OverviewState,
     extract_phase,
     extract_total_iterations,
     increment_total_iterations,
+    parse_overview,
     run_claude_with_retry,
     update_phase,
     validate_session_structure,
@@ -62,7 +70,9 @@ __all__ = [
     # Logging
     "add_session_handler",
     "setup_logging",
+    "stop_logging",
     # Notifications
+    "close_notifications",
     "notify_blocked",
     "notify_complete",
     "notify_error",
@@ -79,9 +89,11 @@ __all__ = [
     # Runner
     "ExecutionResult",
     "ExecutionStatus",
+    "OverviewState",
     "extract_phase",
     "extract_total_iterations",
     "increment_total_iterations",
+    "parse_overview",
     "run_claude_with_retry",
     "update_phase",
     "validate_session_structure",
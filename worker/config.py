@@ -1,6 +1,9 @@
 """Configuration management for Samocode orchestrator."""
 
 import os
+import re
+import stat
+from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -11,8 +14,11 @@ from .timestamps import folder_timestamp
 # Load .env from samocode root directory (parent of worker/)
 load_dotenv(Path(__file__).parent.parent / ".env")
 
+# Dated session folder: YY-MM-DD-{name}
+_DATED_SESSION_RE = re.compile(r"^(\d{2}-\d{2}-\d{2})-(.+)$")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ProjectConfig:
     """Project-specific paths from .samocode file.
 
@@ -59,15 +65,14 @@ class ProjectConfig:
             ("WORKTREES", self.worktrees),
             ("SESSIONS", self.sessions),
         ]:
-            if not path.exists():
-                errors.append(f"{name} does not exist: {path}")
-            elif not path.is_dir():
-                errors.append(f"{name} is not a directory: {path}")
+            error = _check_dir(name, path)
+            if error:
+                errors.append(error)
 
         return errors
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RuntimeConfig:
     """Runtime settings from environment variables."""
 
@@ -79,6 +84,7 @@ class RuntimeConfig:
     claude_timeout: int
     max_retries: int
     retry_delay: int
+    git_branch_prefix: str = ""
 
     @classmethod
     def from_env(cls) -> "RuntimeConfig":
@@ -92,16 +98,21 @@ class RuntimeConfig:
             claude_timeout=int(os.getenv("CLAUDE_TIMEOUT", "1800")),
             max_retries=int(os.getenv("SAMOCODE_MAX_RETRIES", "3")),
             retry_delay=int(os.getenv("SAMOCODE_RETRY_DELAY", "5")),
+            git_branch_prefix=os.getenv("GIT_BRANCH_PREFIX", ""),
         )
 
     def validate(self) -> list[str]:
         """Validate runtime configuration."""
         errors: list[str] = []
 
-        if not self.claude_path.exists():
+        # One stat covers both the existence and file-type checks
+        try:
+            mode = self.claude_path.stat().st_mode
+        except OSError:
             errors.append(f"Claude CLI not found at {self.claude_path}")
-        elif not self.claude_path.is_file():
-            errors.append(f"Claude path is not a file: {self.claude_path}")
+        else:
+            if not stat.S_ISREG(mode):
+                errors.append(f"Claude path is not a file: {self.claude_path}")
 
         if self.claude_max_turns < 1:
             errors.append(f"Invalid max_turns: {self.claude_max_turns}")
@@ -112,7 +123,7 @@ class RuntimeConfig:
         return errors
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SamocodeConfig:
     """Complete configuration combining project and runtime settings."""
 
@@ -173,6 +184,10 @@ class SamocodeConfig:
     def retry_delay(self) -> int:
         return self.runtime.retry_delay
 
+    @property
+    def git_branch_prefix(self) -> str:
+        return self.runtime.git_branch_prefix
+
     def validate(self) -> list[str]:
         """Validate complete configuration."""
         return self.project.validate() + self.runtime.validate()
@@ -188,17 +203,30 @@ class SamocodeConfig:
         )
 
 
+def _check_dir(name: str, path: Path) -> str | None:
+    """Return an error if path isn't an existing directory (single stat)."""
+    try:
+        mode = path.stat().st_mode
+    except OSError:
+        return f"{name} does not exist: {path}"
+    if not stat.S_ISDIR(mode):
+        return f"{name} is not a directory: {path}"
+    return None
+
+
 def _parse_config_file(path: Path) -> dict[str, str]:
     """Parse .samocode file contents into key-value dict."""
-    result: dict[str, str] = {}
-    for line in path.read_text().splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" in line:
-            key, value = line.split("=", 1)
-            result[key.strip()] = value.strip()
-    return result
+    return _parse_config_lines(path.read_text().splitlines())
+
+
+def _parse_config_lines(lines: Iterable[str]) -> dict[str, str]:
+    """Parse KEY=value lines, skipping blanks and # comments."""
+    pairs = (line.strip().partition("=") for line in lines)
+    return {
+        key.strip(): value.strip()
+        for key, sep, value in pairs
+        if sep and not key.startswith("#")
+    }
 
 
 def resolve_session_path(sessions_dir: Path, session_name: str) -> Path:
@@ -206,20 +234,32 @@ def resolve_session_path(sessions_dir: Path, session_name: str) -> Path:
 
     Resolution order:
     1. Exact match: {sessions_dir}/{session_name}/
-    2. Dated match: {sessions_dir}/*-{session_name}/ (most recent if multiple)
+    2. Dated match: {sessions_dir}/YY-MM-DD-{session_name}/ (most recent if multiple)
     3. New session: returns {sessions_dir}/{YY-MM-DD}-{session_name}/ (not created yet)
     """
     # 1. Exact match
     exact = sessions_dir / session_name
-    if exact.exists() and exact.is_dir():
+    if exact.is_dir():
         return exact
 
-    # 2. Dated match (pattern: YY-MM-DD-name)
-    pattern = f"*-{session_name}"
-    matches = sorted(sessions_dir.glob(pattern), reverse=True)  # Most recent first
-    for match in matches:
-        if match.is_dir():
-            return match
+    # 2. Dated match (pattern: YY-MM-DD-name), most recent date wins
+    latest: tuple[str, str] | None = None
+    try:
+        with os.scandir(sessions_dir) as entries:
+            for entry in entries:
+                match = _DATED_SESSION_RE.match(entry.name)
+                if (
+                    match
+                    and match.group(2) == session_name
+                    and (latest is None or match.group(1) > latest[0])
+                    and entry.is_dir()
+                ):
+                    latest = (match.group(1), entry.name)
+    except OSError:
+        # Missing, not a directory or unreadable: validation reports it
+        pass
+    if latest is not None:
+        return sessions_dir / latest[1]
 
     # 3. New session with date prefix
     dated_name = f"{folder_timestamp()}-{session_name}"
@@ -236,9 +276,11 @@ def parse_samocode_file(start_path: Path) -> dict[str, str]:
     home = Path.home()
 
     while current != current.parent and current >= home:
-        samocode_path = current / ".samocode"
-        if samocode_path.exists():
-            return _parse_config_file(samocode_path)
-        current = current.parent
+        # Attempt the read directly; a miss costs one failed open, not stat + open
+        try:
+            return _parse_config_file(current / ".samocode")
+        except (FileNotFoundError, NotADirectoryError):
+            # NotADirectoryError: start_path (or an ancestor) is a file
+            current = current.parent
 
     return {}
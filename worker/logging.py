@@ -1,22 +1,39 @@
 """Logging configuration for Samocode orchestrator."""
 
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+)
 from pathlib import Path
 
+# Background writer for the main logger's console and file handlers
+_listener: QueueListener | None = None
+
 
 def setup_logging(log_dir: Path) -> logging.Logger:
-    """Configure logging to both stdout and rotating file."""
-    log_dir.mkdir(parents=True, exist_ok=True)
-    log_file = log_dir / "samocode.log"
+    """Configure logging to both stdout and rotating file.
+
+    Handlers run on a background QueueListener thread so logging calls only
+    enqueue records. Call stop_logging() to flush (also registered with atexit).
+    """
+    global _listener
 
     logger = logging.getLogger("samocode")
     logger.setLevel(logging.INFO)
 
+    # Already configured: skip directory and handler setup entirely
     if logger.handlers:
         return logger
 
+    log_dir.mkdir(parents=True, exist_ok=True)
+    log_file = log_dir / "samocode.log"
+
     formatter = logging.Formatter(
         "[%(asctime)s] %(levelname)s - %(message)s",
         datefmt="%Y-%m-%dT%H:%M:%S",
@@ -24,30 +41,45 @@ def setup_logging(log_dir: Path) -> logging.Logger:
 
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
 
     file_handler = RotatingFileHandler(
         log_file,
         maxBytes=1_000_000,
         backupCount=5,
+        encoding="utf-8",
+        delay=True,
     )
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+
+    stop_logging()
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, console_handler, file_handler)
+    _listener.start()
+    logger.addHandler(QueueHandler(log_queue))
 
     return logger
 
 
-def add_session_handler(
-    logger: logging.Logger, session_path: Path
-) -> logging.FileHandler:
-    """Add a session-specific file handler to the logger.
+def stop_logging() -> None:
+    """Flush queued records and stop the background log writer."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def add_session_handler(logger: logging.Logger, session_path: Path) -> MemoryHandler:
+    """Add a buffered session-specific file handler to the logger.
+
+    Records are buffered and written in batches: when the buffer fills, on
+    ERROR, on flush() and on close.
 
     Args:
         logger: The logger to add the handler to
         session_path: Path to the session directory
 
     Returns:
-        The created FileHandler so caller can remove it later
+        The created MemoryHandler so caller can flush or remove it later
 
     Raises:
         ValueError: If session_path does not exist
@@ -63,8 +95,18 @@ def add_session_handler(
         datefmt="%Y-%m-%dT%H:%M:%S",
     )
 
-    handler = logging.FileHandler(log_file)
-    handler.setFormatter(formatter)
+    file_handler = logging.FileHandler(log_file, encoding="utf-8", delay=True)
+    file_handler.setFormatter(formatter)
+
+    handler = MemoryHandler(
+        capacity=200,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True,
+    )
     logger.addHandler(handler)
 
     return handler
+
+
+atexit.register(stop_logging)
@@ -5,11 +5,22 @@ Failures are logged but don't stop execution.
 """
 
 import logging
+import random
+import time
 
 import requests
 
 logger = logging.getLogger("samocode.notifications")
 
+# Shared session reuses the TCP+TLS connection to api.telegram.org across notifications
+_session = requests.Session()
+
+# Retry policy for transient failures: exponential backoff with jitter
+MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 5.0
+_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
 
 def send_telegram_message(
     message: str,
@@ -17,7 +28,7 @@ def send_telegram_message(
     chat_id: str,
     timeout: int = 5,
 ) -> bool:
-    """Send message via Telegram Bot API. Single retry on timeout/connection error."""
+    """Send message via Telegram Bot API. Retries transient failures with backoff."""
     if not bot_token or not chat_id:
         logger.debug("Telegram not configured, skipping notification")
         return False
@@ -29,24 +40,22 @@ def send_telegram_message(
         "parse_mode": "Markdown",
     }
 
-    for attempt in range(2):
+    for attempt in range(1, MAX_ATTEMPTS + 1):
         try:
-            response = requests.post(url, json=payload, timeout=timeout)
+            response = _session.post(url, json=payload, timeout=timeout)
             response.raise_for_status()
             logger.debug("Telegram notification sent successfully")
             return True
         except requests.Timeout:
-            if attempt == 0:
-                logger.warning("Telegram notification timed out, retrying...")
-                continue
-            logger.warning("Telegram notification timed out after retry")
-            return False
+            error = "timed out"
         except requests.ConnectionError:
-            if attempt == 0:
-                logger.warning("Telegram connection error, retrying...")
-                continue
-            logger.warning("Telegram connection error after retry")
-            return False
+            error = "connection error"
+        except requests.HTTPError as e:
+            status = e.response.status_code if e.response is not None else None
+            if status not in _RETRY_STATUS_CODES:
+                logger.warning(f"Telegram notification failed: {e}")
+                return False
+            error = f"HTTP {status}"
         except requests.RequestException as e:
             logger.warning(f"Telegram notification failed: {e}")
             return False
@@ -54,9 +63,21 @@ def send_telegram_message(
             logger.warning(f"Unexpected error sending Telegram: {e}")
             return False
 
+        if attempt == MAX_ATTEMPTS:
+            logger.warning(f"Telegram notification {error} after {attempt} attempts")
+            return False
+        delay = _retry_delay(attempt)
+        logger.warning(f"Telegram notification {error}, retrying in {delay:.1f}s...")
+        time.sleep(delay)
+
     return False
 
 
+def close_notifications() -> None:
+    """Close the shared HTTP session. Call once on orchestrator shutdown."""
+    _session.close()
+
+
 def notify_blocked(
     reason: str,
     session_name: str,
@@ -127,3 +148,9 @@ def notify_error(
         f"Check logs for full details."
     )
     send_telegram_message(message, bot_token, chat_id)
+
+
+def _retry_delay(attempt: int) -> float:
+    """Backoff before retry N: base * 2^(N-1), capped, plus random jitter."""
+    backoff = min(RETRY_BASE_DELAY * 2 ** (attempt - 1), RETRY_MAX_DELAY)
+    return backoff + random.uniform(0, RETRY_BASE_DELAY)
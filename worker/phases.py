@@ -6,6 +6,7 @@ This module is the single source of truth for:
 - Phase gates (conditions required to enter a phase)
 """
 
+import functools
 from dataclasses import dataclass
 from enum import Enum
 
@@ -23,7 +24,7 @@ class Phase(Enum):
     DONE = "done"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PhaseConfig:
     """Configuration for a single phase."""
 
@@ -108,8 +109,12 @@ PHASE_CONFIGS: dict[Phase, PhaseConfig] = {
 }
 
 
+@functools.cache
 def get_phase_config(phase_str: str | None) -> PhaseConfig | None:
-    """Get phase configuration by phase name string."""
+    """Get phase configuration by phase name string.
+
+    Cached: PHASE_CONFIGS is immutable at runtime.
+    """
     if phase_str is None:
         return None
     try:
@@ -1,5 +1,8 @@
 """Claude CLI execution with proper error handling and retries."""
 
+import codecs
+import functools
+import io
 import logging
 import os
 import re
@@ -10,7 +13,7 @@ from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import IO, TextIO
+from typing import TextIO
 
 from .config import SamocodeConfig
 from .phases import Phase, get_agent_for_phase
@@ -18,6 +21,34 @@ from .timestamps import file_timestamp, iteration_timestamp, jsonl_timestamp, lo
 
 logger = logging.getLogger("samocode")
 
+# _overview.md status line patterns
+_PHASE_RE = re.compile(r"^Phase:\s*(.+)$", re.MULTILINE)
+_ITERATION_RE = re.compile(r"^Iteration:\s*(\d+)$", re.MULTILINE)
+_TOTAL_ITERATIONS_RE = re.compile(r"^(Total Iterations:\s*)(\d+)$", re.MULTILINE)
+# All three status fields in one alternation, so parse_overview scans once
+_STATUS_FIELDS_RE = re.compile(
+    r"^(?:Phase:\s*(?P<phase>.+)"
+    r"|Iteration:\s*(?P<iteration>\d+)"
+    r"|Total Iterations:\s*(?P<total>\d+))$",
+    re.MULTILINE,
+)
+
+# stdout characters kept in memory; the full stream is written to the JSONL log
+STDOUT_TAIL_CHARS = 8192
+
+# Upper bound for exponential retry backoff (seconds)
+MAX_RETRY_DELAY = 60
+
+# How long to keep reading output after the process exits (seconds); bounds the
+# wait when grandchildren inherited the pipes and keep them open
+EXIT_DRAIN_TIMEOUT = 5.0
+
+# Bytes requested per os.read() on the output pipes
+_PIPE_READ_SIZE = 65536
+
+# Cached file contents keyed by path: (mtime_ns, size, text)
+_file_cache: dict[Path, tuple[int, int, str]] = {}
+
 
 class SessionStructureError(Exception):
     """Raised when session has invalid structure (e.g., nested _samocode subfolder)."""
@@ -81,6 +112,15 @@ class ExecutionResult:
     log_file: Path | None = field(default=None)
 
 
+@dataclass(frozen=True, slots=True)
+class OverviewState:
+    """Status fields parsed from session _overview.md."""
+
+    phase: str | None
+    iteration: int | None
+    total_iterations: int
+
+
 # =============================================================================
 # Public API - Main execution functions
 # =============================================================================
@@ -94,7 +134,10 @@ def run_claude_with_retry(
     initial_task: str | None = None,
     on_line: Callable[[str], None] | None = None,
 ) -> ExecutionResult:
-    """Execute Claude CLI with retry logic for transient failures."""
+    """Execute Claude CLI with retry logic for transient failures.
+
+    Waits retry_delay, doubling after each failed attempt (capped at MAX_RETRY_DELAY).
+    """
     result: ExecutionResult | None = None
 
     for attempt in range(1, config.max_retries + 1):
@@ -112,11 +155,12 @@ def run_claude_with_retry(
             return result
 
         if attempt < config.max_retries:
+            delay = min(config.retry_delay * 2 ** (attempt - 1), MAX_RETRY_DELAY)
             logger.warning(
                 f"Attempt {attempt}/{config.max_retries} failed, "
-                f"retrying in {config.retry_delay}s..."
+                f"retrying in {delay}s..."
             )
-            time.sleep(config.retry_delay)
+            time.sleep(delay)
 
     logger.error(f"All {config.max_retries} attempts failed")
 
@@ -166,15 +210,15 @@ def run_claude_once(
         logger.warning(warning)
 
     # Determine agent based on session state
-    is_new_session = not (session_path / "_overview.md").exists()
-    if is_new_session:
+    overview = parse_overview(session_path)
+    if overview is None:
         phase = "init"
         iteration = 1
         agent_name = "init-agent"
         logger.info("New session detected, using init-agent")
     else:
-        phase = extract_phase(session_path)
-        iteration = extract_iteration(session_path)
+        phase = overview.phase
+        iteration = overview.iteration
         agent_name = get_agent_for_phase(phase)
         if agent_name is None:
             raise ValueError(
@@ -221,13 +265,40 @@ def run_claude_once(
 # =============================================================================
 
 
+def parse_overview(session_path: Path) -> OverviewState | None:
+    """Parse status fields from session _overview.md in a single read.
+
+    Returns None if _overview.md doesn't exist.
+    """
+    content = _read_overview(session_path)
+    if content is None:
+        return None
+
+    # First occurrence of each field wins, as with the single-field extractors
+    fields: dict[str, str] = {}
+    for match in _STATUS_FIELDS_RE.finditer(content):
+        name = match.lastgroup
+        if name is not None and name not in fields:
+            fields[name] = match.group(name)
+            if len(fields) == 3:
+                break
+
+    phase = fields.get("phase")
+    iteration = fields.get("iteration")
+    return OverviewState(
+        phase=phase.strip() if phase is not None else None,
+        iteration=int(iteration) if iteration is not None else None,
+        total_iterations=int(fields.get("total", 0)),
+    )
+
+
 def extract_phase(session_path: Path) -> str | None:
     """Extract Phase from session _overview.md Status section."""
     content = _read_overview(session_path)
     if content is None:
         return None
 
-    match = re.search(r"^Phase:\s*(.+)$", content, re.MULTILINE)
+    match = _PHASE_RE.search(content)
     return match.group(1).strip() if match else None
 
 
@@ -236,23 +307,16 @@ def update_phase(session_path: Path, new_phase: str) -> bool:
 
     Returns True if updated, False if file doesn't exist or no Phase field found.
     """
-    overview_path = session_path / "_overview.md"
-    if not overview_path.exists():
+    content = _read_overview(session_path)
+    if content is None:
         return False
 
-    content = overview_path.read_text()
-    new_content, count = re.subn(
-        r"^Phase:\s*.+$",
-        f"Phase: {new_phase}",
-        content,
-        count=1,
-        flags=re.MULTILINE,
-    )
+    new_content, count = _PHASE_RE.subn(f"Phase: {new_phase}", content, count=1)
 
     if count == 0:
         return False
 
-    overview_path.write_text(new_content)
+    _write_cached(session_path / "_overview.md", new_content)
     return True
 
 
@@ -262,7 +326,7 @@ def extract_iteration(session_path: Path) -> int | None:
     if content is None:
         return None
 
-    match = re.search(r"^Iteration:\s*(\d+)$", content, re.MULTILINE)
+    match = _ITERATION_RE.search(content)
     return int(match.group(1)) if match else None
 
 
@@ -272,8 +336,8 @@ def extract_total_iterations(session_path: Path) -> int:
     if content is None:
         return 0
 
-    match = re.search(r"^Total Iterations:\s*(\d+)$", content, re.MULTILINE)
-    return int(match.group(1)) if match else 0
+    match = _TOTAL_ITERATIONS_RE.search(content)
+    return int(match.group(2)) if match else 0
 
 
 def increment_total_iterations(session_path: Path) -> int:
@@ -282,26 +346,25 @@ def increment_total_iterations(session_path: Path) -> int:
     If Total Iterations line doesn't exist, adds it after Iteration line.
     """
     overview_path = session_path / "_overview.md"
-    if not overview_path.exists():
+    content = _read_overview(session_path)
+    if content is None:
         return 1
 
-    content = overview_path.read_text()
-
     # Try to find and increment existing counter
-    match = re.search(r"^(Total Iterations:\s*)(\d+)$", content, re.MULTILINE)
+    match = _TOTAL_ITERATIONS_RE.search(content)
     if match:
         current = int(match.group(2))
         new_value = current + 1
         new_content = content[: match.start(2)] + str(new_value) + content[match.end(2) :]
-        overview_path.write_text(new_content)
+        _write_cached(overview_path, new_content)
         return new_value
 
     # Add Total Iterations after Iteration line
-    iteration_match = re.search(r"^(Iteration:\s*\d+)$", content, re.MULTILINE)
+    iteration_match = _ITERATION_RE.search(content)
     if iteration_match:
         insert_pos = iteration_match.end()
         new_content = content[:insert_pos] + "\nTotal Iterations: 1" + content[insert_pos:]
-        overview_path.write_text(new_content)
+        _write_cached(overview_path, new_content)
         return 1
 
     return 1
@@ -326,7 +389,7 @@ def build_session_context(
     Includes workflow.md (common context for all phases) plus session-specific details.
     """
     # Start with workflow.md - common context for all phases
-    lines = [workflow_prompt_path.read_text().strip()]
+    lines = [_read_cached(workflow_prompt_path).strip()]
 
     # Add session-specific context
     lines.append("\n\n# Session Context")
@@ -403,8 +466,13 @@ def stream_logs(
     timeout: float,
     on_line: Callable[[str], None] | None = None,
 ) -> tuple[str, str]:
-    """Stream stdout from process to JSONL file with timeout support."""
-    stdout_lines: list[str] = []
+    """Stream stdout from process to JSONL file with timeout support.
+
+    Returns (stdout, stderr). Only the last STDOUT_TAIL_CHARS characters of stdout
+    are kept in memory; the complete output lives in log_file. Output is read for
+    at most EXIT_DRAIN_TIMEOUT seconds after the process exits.
+    """
+    stdout_tail = ""
     stderr_lines: list[str] = []
     deadline = time.time() + timeout
 
@@ -415,35 +483,61 @@ def stream_logs(
 
     log_file.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(log_file, "w", encoding="utf-8") as f:
-        while True:
-            remaining = deadline - time.time()
-            if remaining <= 0:
-                raise subprocess.TimeoutExpired(cmd="claude", timeout=timeout)
+    stdout_reader = _PipeLineReader(stdout_pipe.fileno())
+    stderr_reader = _PipeLineReader(stderr_pipe.fileno())
+    # Pipes still open; closed pipes are always readable and would spin select
+    open_readers = {r.fd: r for r in (stdout_reader, stderr_reader)}
+    # Readable on process exit; without it, fall back to re-polling every second
+    exit_fd = _open_exit_fd(process)
+    exited = False
 
-            if process.poll() is not None:
-                _drain_remaining(
-                    stdout_pipe, stderr_pipe, stdout_lines, stderr_lines, f, on_line
-                )
-                break
+    try:
+        with open(log_file, "w", encoding="utf-8") as f:
+            while open_readers:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    if exited:
+                        # Grandchildren still hold the pipes; stop waiting for EOF
+                        break
+                    raise subprocess.TimeoutExpired(cmd="claude", timeout=timeout)
+
+                if not exited and process.poll() is not None:
+                    # Keep draining, but only until EXIT_DRAIN_TIMEOUT
+                    exited = True
+                    deadline = min(deadline, time.time() + EXIT_DRAIN_TIMEOUT)
+                    continue
+
+                watched = list(open_readers)
+                if exit_fd is None:
+                    remaining = min(remaining, 1.0)
+                elif not exited:
+                    # Always readable once the process is gone
+                    watched.append(exit_fd)
+                readable, _, _ = select.select(watched, [], [], remaining)
+
+                for fd in readable:
+                    reader = open_readers.get(fd)
+                    if reader is None:
+                        continue
+                    lines = reader.read_lines()
+                    if reader.eof:
+                        del open_readers[fd]
+                    if reader is stdout_reader:
+                        stdout_tail = _write_stdout(lines, stdout_tail, f, on_line)
+                    else:
+                        stderr_lines.extend(lines)
 
-            readable, _, _ = select.select(
-                [stdout_pipe, stderr_pipe], [], [], min(remaining, 1.0)
-            )
+            # Keep a trailing partial line when we stopped before EOF
+            stdout_tail = _write_stdout(stdout_reader.flush(), stdout_tail, f, on_line)
+            stderr_lines.extend(stderr_reader.flush())
+    finally:
+        if exit_fd is not None:
+            os.close(exit_fd)
 
-            for stream in readable:
-                line = stream.readline()
-                if line:
-                    if stream is stdout_pipe:
-                        stdout_lines.append(line)
-                        f.write(line)
-                        f.flush()
-                        if on_line:
-                            on_line(line)
-                    else:
-                        stderr_lines.append(line)
+    # Output finished: block until the process exits instead of polling
+    process.wait(timeout=max(deadline - time.time(), 0))
 
-    return "".join(stdout_lines), "".join(stderr_lines)
+    return stdout_tail, "".join(stderr_lines)
 
 
 # =============================================================================
@@ -452,32 +546,57 @@ def stream_logs(
 
 
 def _read_overview(session_path: Path) -> str | None:
-    """Read _overview.md content, returns None if not exists."""
-    overview_path = session_path / "_overview.md"
-    if not overview_path.exists():
+    """Read _overview.md content (cached until modified), returns None if not exists."""
+    try:
+        return _read_cached(session_path / "_overview.md")
+    except FileNotFoundError:
         return None
-    return overview_path.read_text()
 
 
-def _build_config_section(session_path: Path, config: SamocodeConfig) -> list[str]:
-    """Build configuration section for prompts."""
-    lines: list[str] = []
+def _read_cached(path: Path) -> str:
+    """Read file content, reusing the cached text while mtime and size are unchanged."""
+    st = path.stat()
+    cached = _file_cache.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    content = path.read_text()
+    _file_cache[path] = (st.st_mtime_ns, st.st_size, content)
+    return content
+
+
+def _write_cached(path: Path, content: str) -> None:
+    """Write file content and refresh its cache entry so the next read is a hit."""
+    path.write_text(content)
+    st = path.stat()
+    _file_cache[path] = (st.st_mtime_ns, st.st_size, content)
+
+
+@functools.lru_cache(maxsize=16)
+def _build_config_section(
+    session_path: Path, config: SamocodeConfig
+) -> tuple[str, ...]:
+    """Build configuration section for prompts.
 
+    Cached: the section only depends on the session and config, both fixed for a run.
+    """
     session_name = session_path.name
     worktree_path = config.worktrees_dir / session_name
-    branch_prefix = os.getenv("GIT_BRANCH_PREFIX", "")
-    branch_name = session_name.split("-", 3)[-1]
+    branch_name = _branch_name(session_name, config.git_branch_prefix)
+
+    return (
+        "## Worktree Configuration",
+        f"- Base repo (create worktrees FROM here): `{config.repo_path}`",
+        "- Base branch: `origin/main` or `origin/master` (detect with `git remote show origin`)",
+        f"- Worktree path: `{worktree_path}`",
+        f"- Branch name: `{branch_name}`",
+    )
 
-    lines.append("## Worktree Configuration")
-    lines.append(f"- Base repo (create worktrees FROM here): `{config.repo_path}`")
-    lines.append(f"- Base branch: `origin/main` or `origin/master` (detect with `git remote show origin`)")
-    lines.append(f"- Worktree path: `{worktree_path}`")
-    if branch_prefix:
-        lines.append(f"- Branch name: `{branch_prefix}/{branch_name}`")
-    else:
-        lines.append(f"- Branch name: `{branch_name}`")
 
-    return lines
+def _branch_name(session_name: str, branch_prefix: str) -> str:
+    """Derive git branch name from session folder name (drops YY-MM-DD- prefix)."""
+    branch_name = session_name.split("-", 3)[-1]
+    return f"{branch_prefix}/{branch_name}" if branch_prefix else branch_name
 
 
 def _build_initial_instructions(
@@ -528,6 +647,8 @@ def _execute_process(
         process = subprocess.Popen(
             cli_args,
             cwd=str(working_dir),
+            # Keep the child off the orchestrator's terminal
+            stdin=subprocess.DEVNULL,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
@@ -577,6 +698,13 @@ def _execute_process(
             log_file=log_file,
         )
 
+    except KeyboardInterrupt:
+        # Don't leave Claude running after Ctrl-C; let the orchestrator exit
+        if process is not None:
+            process.kill()
+            process.wait()
+        raise
+
     except Exception as e:
         if process is not None:
             process.kill()
@@ -592,19 +720,70 @@ def _execute_process(
         )
 
 
-def _drain_remaining(
-    stdout_pipe: IO[str],
-    stderr_pipe: IO[str],
-    stdout_lines: list[str],
-    stderr_lines: list[str],
+def _open_exit_fd(process: subprocess.Popen[str]) -> int | None:
+    """Open a pidfd that becomes readable when process exits (Linux 5.3+).
+
+    Returns None where pidfds are unsupported.
+    """
+    if not hasattr(os, "pidfd_open"):
+        return None
+    try:
+        return os.pidfd_open(process.pid)
+    except OSError:
+        return None
+
+
+@dataclass(slots=True)
+class _PipeLineReader:
+    """Split raw reads from a pipe into lines.
+
+    Reads the fd directly: lines sitting in a Python-level buffer would not make
+    select() report the pipe readable again.
+    """
+
+    fd: int
+    eof: bool = False
+    _decoder: io.IncrementalNewlineDecoder = field(
+        default_factory=lambda: io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder("utf-8")(errors="replace"), translate=True
+        )
+    )
+    _partial: str = ""
+
+    def read_lines(self) -> list[str]:
+        """Read once without blocking (after select); return complete lines."""
+        chunk = os.read(self.fd, _PIPE_READ_SIZE)
+        self.eof = not chunk
+        text = self._partial + self._decoder.decode(chunk, final=self.eof)
+        *lines, self._partial = text.split("\n")
+        if self.eof:
+            return [f"{line}\n" for line in lines] + self.flush()
+        return [f"{line}\n" for line in lines]
+
+    def flush(self) -> list[str]:
+        """Return the pending partial line, if any."""
+        partial, self._partial = self._partial, ""
+        return [partial] if partial else []
+
+
+def _write_stdout(
+    lines: list[str],
+    tail: str,
     log_file: TextIO,
     on_line: Callable[[str], None] | None,
-) -> None:
-    """Drain remaining output from pipes after process finishes."""
-    for line in stdout_pipe:
-        stdout_lines.append(line)
+) -> str:
+    """Write stdout lines to the log and on_line; returns the updated tail."""
+    for line in lines:
+        tail = _append_tail(tail, line)
         log_file.write(line)
         if on_line:
             on_line(line)
-    for line in stderr_pipe:
-        stderr_lines.append(line)
+    log_file.flush()
+    return tail
+
+
+def _append_tail(tail: str, line: str) -> str:
+    """Append line to tail, keeping only the last STDOUT_TAIL_CHARS characters."""
+    if len(line) >= STDOUT_TAIL_CHARS:
+        return line[-STDOUT_TAIL_CHARS:]
+    return (tail + line)[-STDOUT_TAIL_CHARS:]
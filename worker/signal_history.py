@@ -71,12 +71,14 @@ def get_phase_iteration_count(session_path: Path, phase: str) -> int:
     Useful for enforcing per-phase iteration limits.
     """
     history_file = session_path / "_signal_history.jsonl"
-    if not history_file.exists():
+    try:
+        content = history_file.read_text()
+    except FileNotFoundError:
         return 0
 
     count = 0
     phase_lower = phase.lower()
-    for line in history_file.read_text().splitlines():
+    for line in content.splitlines():
         if not line.strip():
             continue
         try:
@@ -93,11 +95,13 @@ def get_phase_iteration_count(session_path: Path, phase: str) -> int:
 def read_signal_history(session_path: Path) -> list[SignalHistoryEntry]:
     """Read all signal history entries for debugging."""
     history_file = session_path / "_signal_history.jsonl"
-    if not history_file.exists():
+    try:
+        content = history_file.read_text()
+    except FileNotFoundError:
         return []
 
     entries: list[SignalHistoryEntry] = []
-    for line in history_file.read_text().splitlines():
+    for line in content.splitlines():
         if not line.strip():
             continue
         try:
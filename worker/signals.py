@@ -1,6 +1,7 @@
 """Signal file operations for orchestrator flow control."""
 
 import json
+import os
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -15,7 +16,7 @@ class SignalStatus(Enum):
     WAITING = "waiting"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Signal:
     """Signal from Claude to orchestrator."""
 
@@ -38,19 +39,32 @@ class Signal:
         }
 
 
+_STATUS_BY_VALUE: dict[str, SignalStatus] = {s.value: s for s in SignalStatus}
+
+# Session directories already created by clear_signal_file
+_ensured_dirs: set[Path] = set()
+
+
 def clear_signal_file(session_path: Path) -> str | None:
     """Clear signal file at start of each iteration.
 
     Returns previous contents if file existed and had content, None otherwise.
     """
-    session_path.mkdir(parents=True, exist_ok=True)
+    if session_path not in _ensured_dirs:
+        session_path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(session_path)
     signal_file = session_path / "_signal.json"
     previous: str | None = None
-    if signal_file.exists():
-        content = signal_file.read_text().strip()
-        if content and content != "{}":
-            previous = content
-    signal_file.write_text("{}")
+    try:
+        content = signal_file.read_bytes().strip()
+    except FileNotFoundError:
+        content = b""
+    if content and content != b"{}":
+        previous = content.decode("utf-8", errors="replace")
+    # Write-then-rename so readers never see a truncated file
+    tmp_file = session_path / "_signal.json.tmp"
+    tmp_file.write_bytes(b"{}")
+    os.replace(tmp_file, signal_file)
     return previous
 
 
@@ -58,24 +72,23 @@ def read_signal_file(session_path: Path) -> Signal:
     """Read and parse signal file. Returns BLOCKED signal on parse errors."""
     signal_file = session_path / "_signal.json"
 
-    if not signal_file.exists():
-        return Signal(
-            status=SignalStatus.BLOCKED,
-            reason="Signal file not created",
-            needs="investigation",
-        )
-
     try:
-        data = json.loads(signal_file.read_text())
+        raw = signal_file.read_bytes().strip()
+        # Fast path for the sentinel written by clear_signal_file
+        if raw == b"{}":
+            return Signal(status=SignalStatus.CONTINUE)
+
+        data = json.loads(raw)
 
         if not data:
             return Signal(status=SignalStatus.CONTINUE)
 
-        status_str = data.get("status", "").lower()
-
-        try:
-            status = SignalStatus(status_str)
-        except ValueError:
+        raw_status = data.get("status", "")
+        status_str = (
+            raw_status.lower() if isinstance(raw_status, str) else str(raw_status)
+        )
+        status = _STATUS_BY_VALUE.get(status_str)
+        if status is None:
             return Signal(
                 status=SignalStatus.BLOCKED,
                 reason=f"Invalid signal status: {status_str}",
@@ -91,6 +104,12 @@ def read_signal_file(session_path: Path) -> Signal:
             phase=data.get("phase"),
         )
 
+    except FileNotFoundError:
+        return Signal(
+            status=SignalStatus.BLOCKED,
+            reason="Signal file not created",
+            needs="investigation",
+        )
     except json.JSONDecodeError as e:
         return Signal(
             status=SignalStatus.BLOCKED,